@@ -159,22 +159,34 @@ TinyPG's github repository is available there:
 
 """
 
-from .config import TinyPGConfig
-from .context import async_database, database, database_pool
-from .core import AsyncEphemeralDB, EphemeralDB, PersistentDB
-from .exceptions import (
-    BinaryNotFoundError,
-    DatabaseStartError,
-    DatabaseTimeoutError,
-    DownloadError,
-    TinyPGError,
-)
-from .extensions import (
-    ExtensionManifest,
-    ExtensionSpec,
-    get_available_extension,
-    list_available_extensions,
-)
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from .config import TinyPGConfig
+    from .context import (
+        async_database,
+        async_database_pool,
+        async_database_pool_connections,
+        database,
+        database_cluster,
+        database_pool,
+        database_pool_connections,
+    )
+    from .core import AsyncEphemeralDB, EphemeralDB, PersistentDB
+    from .exceptions import (
+        BinaryNotFoundError,
+        DatabaseStartError,
+        DatabaseTimeoutError,
+        DownloadError,
+        TinyPGError,
+    )
+    from .extensions import (
+        ExtensionManifest,
+        ExtensionSpec,
+        get_available_extension,
+        list_available_extensions,
+    )
 
 __version__ = "0.2.0"
 
@@ -189,6 +201,10 @@ __all__ = [
     "database",
     "async_database",
     "database_pool",
+    "async_database_pool",
+    "database_pool_connections",
+    "async_database_pool_connections",
+    "database_cluster",
     "TinyPGConfig",
     "TinyPGError",
     "DatabaseStartError",
@@ -197,3 +213,45 @@ __all__ = [
     "DatabaseTimeoutError",
     "__version__",
 ]
+
+# Public names are resolved on first access (PEP 562) so that importing
+# ``tinypg`` does not pull in ``requests``, ``psycopg2`` helpers and the
+# binary management code until they are actually needed.
+_LAZY = {
+    "TinyPGConfig": ".config",
+    "async_database": ".context",
+    "async_database_pool": ".context",
+    "async_database_pool_connections": ".context",
+    "database": ".context",
+    "database_cluster": ".context",
+    "database_pool": ".context",
+    "database_pool_connections": ".context",
+    "AsyncEphemeralDB": ".core",
+    "EphemeralDB": ".core",
+    "PersistentDB": ".core",
+    "BinaryNotFoundError": ".exceptions",
+    "DatabaseStartError": ".exceptions",
+    "DatabaseTimeoutError": ".exceptions",
+    "DownloadError": ".exceptions",
+    "TinyPGError": ".exceptions",
+    "ExtensionManifest": ".extensions",
+    "ExtensionSpec": ".extensions",
+    "get_available_extension": ".extensions",
+    "list_available_extensions": ".extensions",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    # Only advertise the public API, not helpers such as ``importlib``
+    dunders = {name for name in globals() if name.startswith("__")}
+    return sorted(dunders | set(__all__))
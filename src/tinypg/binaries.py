@@ -2,6 +2,7 @@
 PostgreSQL binary management - download, install, and manage PostgreSQL binaries.
 """
 
+import functools
 import lzma
 import os
 import platform
@@ -9,6 +10,7 @@ import shutil
 import subprocess
 import tarfile
 import tempfile
+import threading
 import zipfile
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
@@ -19,6 +21,44 @@ from .config import TinyPGConfig
 from .exceptions import BinaryNotFoundError, DownloadError, ProcessError
 from .extensions import ExtensionManifest
 
+# Installation directories of versions already verified by ``ensure_version``
+# in this process, keyed by ``(cache_dir, version)``.
+_READY_VERSIONS: Dict[Tuple[Path, str], Path] = {}
+_READY_LOCK = threading.Lock()
+
+# Resolved binary paths keyed by ``(cache_dir, binary_name, version)``
+_BINARY_PATHS: Dict[Tuple[Path, str, str], Path] = {}
+
+
+@functools.lru_cache(maxsize=None)
+def _detect_linux_musl(force_glibc: bool) -> bool:
+    """Detect a musl-based Linux libc.
+
+    Cached for the lifetime of the process because it scans the interpreter
+    binary and spawns ``ldd``, and the answer cannot change at runtime.
+    """
+    libc, _ = platform.libc_ver()
+    if libc and libc.lower().startswith("musl") and not force_glibc:
+        # Will use a musl build unless TINYPG_GLIBC=1
+        # tinypg glibc binaries works on alpine (extensions as well)
+        # with gcompat
+        return True
+
+    if Path("/etc/alpine-release").exists():
+        return True
+
+    try:
+        result = subprocess.run(
+            ["ldd", "--version"], capture_output=True, text=True, check=False
+        )
+        combined_output = f"{result.stdout}\n{result.stderr}".lower()
+        if "musl" in combined_output:
+            return True
+    except FileNotFoundError:
+        pass
+
+    return False
+
 
 class PostgreSQLBinaries:
     """Manages PostgreSQL binary installation and versioning."""
@@ -93,28 +133,7 @@ class PostgreSQLBinaries:
         if self.os_name != "linux":
             return False
 
-        libc, _ = platform.libc_ver()
-        force_glibc = bool(os.environ.get("TINYPG_GLIBC"))
-        if libc and libc.lower().startswith("musl") and not force_glibc:
-            # Will use a musl build unless TINYPG_GLIBC=1
-            # tinypg glibc binaries works on alpine (extensions as well)
-            # with gcompat
-            return True
-
-        if Path("/etc/alpine-release").exists():
-            return True
-
-        try:
-            result = subprocess.run(
-                ["ldd", "--version"], capture_output=True, text=True, check=False
-            )
-            combined_output = f"{result.stdout}\n{result.stderr}".lower()
-            if "musl" in combined_output:
-                return True
-        except FileNotFoundError:
-            pass
-
-        return False
+        return _detect_linux_musl(bool(os.environ.get("TINYPG_GLIBC")))
 
     @classmethod
     def ensure_version(cls, version: str) -> Path:
@@ -131,11 +150,30 @@ class PostgreSQLBinaries:
             BinaryNotFoundError: If version is not supported
             DownloadError: If download fails
         """
-        manager = cls()
-
         if version not in cls.SUPPORTED_VERSIONS:
             raise BinaryNotFoundError(f"Unsupported PostgreSQL version: {version}")
 
+        key = (TinyPGConfig.cache_dir, version)
+
+        # Fast path: this version was already resolved in this process
+        ready = _READY_VERSIONS.get(key)
+        if ready is not None:
+            return ready
+
+        with _READY_LOCK:
+            ready = _READY_VERSIONS.get(key)
+            if ready is not None:
+                return ready
+
+            ready = cls._resolve_version(version)
+            _READY_VERSIONS[key] = ready
+            return ready
+
+    @classmethod
+    def _resolve_version(cls, version: str) -> Path:
+        """Locate or install ``version`` without consulting the process cache."""
+        manager = cls()
+
         install_dir = manager._get_install_dir(version)
 
         # Check if already installed
@@ -164,11 +202,25 @@ class PostgreSQLBinaries:
         Raises:
             BinaryNotFoundError: If binary is not found
         """
-        manager = cls()
-
         if version is None:
             version = TinyPGConfig.default_version
 
+        key = (TinyPGConfig.cache_dir, binary_name, version)
+
+        # Reuse an earlier resolution as long as the binary is still there
+        cached = _BINARY_PATHS.get(key)
+        if cached is not None and os.access(cached, os.X_OK):
+            return cached
+
+        binary_path = cls._resolve_binary_path(binary_name, version)
+        _BINARY_PATHS[key] = binary_path
+        return binary_path
+
+    @classmethod
+    def _resolve_binary_path(cls, binary_name: str, version: str) -> Path:
+        """Locate ``binary_name`` without consulting the process cache."""
+        manager = cls()
+
         # Check system installation first
         system_binary = shutil.which(binary_name)
         if system_binary and manager._verify_system_binary_version(
@@ -39,6 +39,19 @@ class TinyPGConfig:
     # System temp directory override
     system_temp_dir: Optional[str] = None
 
+    # Place ephemeral data directories on a RAM-backed filesystem. Data does
+    # not survive a reboot, so this is only meant for tests.
+    use_tmpfs: bool = False
+
+    # tmpfs mount used when ``use_tmpfs`` is enabled. When running as root its
+    # parent directories must be traversable by the runtime user.
+    tmpfs_dir: str = "/dev/shm"
+
+    # Directory holding pre-initialized clusters that ephemeral databases are
+    # cloned from instead of running initdb (disabled when None). When running
+    # as root its parent directories must be traversable by the runtime user.
+    template_cache_dir: Optional[Path] = None
+
     # Runtime user/group used when dropping privileges for PostgreSQL helpers
     runtime_user: Optional[str] = None
     runtime_group: Optional[str] = None
@@ -54,6 +67,11 @@ class TinyPGConfig:
         """Set the default PostgreSQL version to use."""
         cls.default_version = version
 
+    @classmethod
+    def set_template_cache_dir(cls, path: Optional[Path]) -> None:
+        """Enable initdb templates stored in ``path`` (``None`` disables them)."""
+        cls.template_cache_dir = Path(path) if path is not None else None
+
     @classmethod
     def get_temp_dir(cls) -> Path:
         """Get the system temporary directory."""
@@ -61,6 +79,19 @@ class TinyPGConfig:
             return Path(cls.system_temp_dir)
         return Path(os.environ.get("TMPDIR", "/tmp"))
 
+    @classmethod
+    def get_data_root(cls) -> Optional[Path]:
+        """Get the parent directory for ephemeral data directories.
+
+        Returns the tmpfs directory when ``use_tmpfs`` is enabled and it
+        exists, otherwise ``None`` (the default temporary directory).
+        """
+        if cls.use_tmpfs:
+            tmpfs = Path(cls.tmpfs_dir)
+            if tmpfs.is_dir():
+                return tmpfs
+        return None
+
     @classmethod
     def get_cache_dir(cls) -> Path:
         """Get the cache directory, creating it if necessary."""
@@ -1,11 +1,116 @@
 """Context manager interfaces for TinyPG."""
 
 import asyncio
+import signal
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from contextlib import asynccontextmanager, contextmanager
-from typing import AsyncContextManager, ContextManager, Dict, List, Optional, Sequence
-
+from typing import (
+    TYPE_CHECKING,
+    AsyncContextManager,
+    Awaitable,
+    ContextManager,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    TypeVar,
+)
+from urllib.parse import quote, urlsplit
+
+from .binaries import PostgreSQLBinaries
+from .config import TinyPGConfig
 from .core import AsyncEphemeralDB, EphemeralDB
-from .extensions import ExtensionInput
+from .extensions import ExtensionInput, ExtensionSpec
+from .port_manager import get_free_ports
+
+if TYPE_CHECKING:
+    import asyncpg
+    from psycopg2.extensions import connection
+
+T = TypeVar("T")
+
+
+def _warm_connection(uri: str) -> None:
+    """Open a connection to ``uri`` and run a trivial query."""
+
+    import psycopg2
+
+    conn = psycopg2.connect(uri)
+    try:
+        with conn.cursor() as cur:
+            cur.execute("SELECT 1")
+            cur.fetchone()
+    finally:
+        conn.close()
+
+
+async def _async_warm_connection(uri: str) -> None:
+    """Async counterpart of :func:`_warm_connection`.
+
+    Uses ``asyncpg`` when the optional ``async`` extra is installed and falls
+    back to running the ``psycopg2`` variant in a worker thread otherwise.
+    """
+
+    try:
+        import asyncpg
+    except ImportError:
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, _warm_connection, uri)
+        return
+
+    conn = await asyncpg.connect(uri)
+    try:
+        await conn.fetchval("SELECT 1")
+    finally:
+        await conn.close()
+
+
+def _pool_ports(pool_size: int, base_port: Optional[int]) -> List[int]:
+    """Pick one port per pool member.
+
+    Without a ``base_port`` all ports are reserved up front so concurrently
+    starting members never race for the same free port.
+    """
+
+    if base_port is None:
+        return get_free_ports(pool_size)
+
+    return [base_port + i for i in range(pool_size)]
+
+
+def _uri_with_dbname(uri: str, dbname: str) -> str:
+    """Return ``uri`` pointing at database ``dbname``."""
+
+    # Built by hand because urlunsplit drops the empty authority of
+    # Unix-socket URIs (``postgresql:///postgres?host=...``).
+    parts = urlsplit(uri)
+    result = f"{parts.scheme}://{parts.netloc}/{quote(dbname, safe='')}"
+    return f"{result}?{parts.query}" if parts.query else result
+
+
+async def _await_shielded(aw: Awaitable[T]) -> T:
+    """Await ``aw`` to completion even if the calling task is cancelled.
+
+    Cancellation requests received while waiting are deferred and re-raised
+    once ``aw`` has finished.
+    """
+
+    task = asyncio.ensure_future(aw)
+    cancelled = False
+
+    while True:
+        try:
+            result = await asyncio.shield(task)
+            break
+        except asyncio.CancelledError:
+            if task.done():
+                raise
+            cancelled = True
+
+    if cancelled:
+        raise asyncio.CancelledError()
+
+    return result
 
 
 @contextmanager
@@ -16,6 +121,7 @@ def database(
     version: str = None,
     keep_data: bool = False,
     extensions: Optional[Sequence[ExtensionInput]] = None,
+    warm: bool = False,
 ) -> ContextManager[str]:
     """Yield a temporary PostgreSQL database URI.
 
@@ -33,6 +139,9 @@ def database(
         extensions: Optional collection of extensions to install immediately
             after the server starts. Entries can be provided in any format
             accepted by :class:`tinypg.ExtensionSpec`.
+        warm: When ``True`` a throwaway connection runs ``SELECT 1`` before
+            the URI is yielded so the first real query avoids cold-start
+            latency.
 
     Yields:
         str: PostgreSQL connection URI for the running database instance.
@@ -58,6 +167,8 @@ def database(
 
     try:
         uri = db.start()
+        if warm:
+            _warm_connection(uri)
         yield uri
     finally:
         db.stop()
@@ -71,6 +182,7 @@ async def async_database(
     version: str = None,
     keep_data: bool = False,
     extensions: Optional[Sequence[ExtensionInput]] = None,
+    warm: bool = False,
 ) -> AsyncContextManager[str]:
     """Asynchronously yield a temporary PostgreSQL database URI.
 
@@ -88,6 +200,9 @@ async def async_database(
         extensions: Optional collection of extensions to install immediately
             after the server starts. Entries can be provided in any format
             accepted by :class:`tinypg.ExtensionSpec`.
+        warm: When ``True`` a throwaway connection runs ``SELECT 1`` before
+            the URI is yielded so the first real query avoids cold-start
+            latency.
 
     Yields:
         str: PostgreSQL connection URI for the running database instance.
@@ -112,10 +227,25 @@ async def async_database(
     )
 
     try:
-        uri = await db.start()
+        # start() runs in an executor thread that cancellation cannot stop,
+        # so wait for it to finish before cleaning up; otherwise the server
+        # could come up after stop() already ran.
+        uri = await _await_shielded(db.start())
+        if warm:
+            await _async_warm_connection(uri)
         yield uri
     finally:
-        await db.stop()
+        # Shield the shutdown from cancellation of the surrounding task. If
+        # the task is cancelled again while stopping, SIGKILL the server so
+        # the in-flight stop() returns promptly, and still wait for it so the
+        # data directory is cleaned up exactly once.
+        stop_task = asyncio.ensure_future(db.stop())
+        try:
+            await asyncio.shield(stop_task)
+        except asyncio.CancelledError:
+            db._signal_postmaster(signal.SIGKILL)
+            await _await_shielded(stop_task)
+            raise
 
 
 @contextmanager
@@ -125,6 +255,7 @@ def database_pool(
     version: str = None,
     base_port: Optional[int] = None,
     extensions: Optional[Sequence[ExtensionInput]] = None,
+    warm: bool = False,
 ) -> ContextManager[List[str]]:
     """Create a pool of independent PostgreSQL databases.
 
@@ -139,6 +270,8 @@ def database_pool(
         extensions: Optional collection of extensions to install immediately
             after each server starts. Entries can be provided in any format
             accepted by :class:`tinypg.ExtensionSpec`.
+        warm: When ``True`` each database is warmed with a ``SELECT 1``
+            query before the URIs are yielded.
 
     Yields:
         list[str]: Connection URIs for the running databases.
@@ -154,31 +287,66 @@ def database_pool(
                 conn.close()
         ```
     """
-    databases = []
-    uris = []
+    # Resolve the binaries once so every pool member hits the cached fast path.
+    PostgreSQLBinaries.ensure_version(version or TinyPGConfig.default_version)
+
+    ports = _pool_ports(pool_size, base_port)
+
+    databases = [
+        EphemeralDB(
+            port=ports[i],
+            cleanup_timeout=timeout,
+            version=version,
+            extensions=extensions,
+        )
+        for i in range(pool_size)
+    ]
+    uris: List[str] = [""] * pool_size
+
+    def _start_one(i: int) -> None:
+        uris[i] = databases[i].start()
+        if warm:
+            _warm_connection(uris[i])
 
     try:
-        for i in range(pool_size):
-            port = None if base_port is None else base_port + i
-
-            db = EphemeralDB(
-                port=port,
-                cleanup_timeout=timeout,
-                version=version,
-                extensions=extensions,
-            )
-
-            uri = db.start()
-            databases.append(db)
-            uris.append(uri)
+        # Start all databases concurrently; initdb and pg_ctl spend most of
+        # their time in child processes so threads overlap nicely.
+        with ThreadPoolExecutor(max_workers=max(pool_size, 1)) as executor:
+            futures = [executor.submit(_start_one, i) for i in range(pool_size)]
+            for future in as_completed(futures):
+                future.result()
 
         yield uris
 
     finally:
-        # Clean up all databases
-        for db in databases:
+        # Clean up all databases concurrently
+        _stop_all(databases)
+
+
+def _request_immediate_shutdown(databases: Sequence[EphemeralDB]) -> None:
+    """Ask every postmaster to shut down immediately, without waiting.
+
+    SIGQUIT is PostgreSQL's "immediate" shutdown mode; skipping the
+    checkpoint is fine because pool data directories are thrown away.
+    """
+
+    for db in databases:
+        db._signal_postmaster(signal.SIGQUIT)
+
+
+def _stop_all(databases: Sequence[EphemeralDB]) -> None:
+    """Stop every database in parallel, ignoring individual failures."""
+
+    if not databases:
+        return
+
+    _request_immediate_shutdown(databases)
+
+    with ThreadPoolExecutor(max_workers=len(databases)) as executor:
+        futures = [executor.submit(db.stop) for db in databases]
+        for future in as_completed(futures):
             try:
-                db.stop()
+                future.result()
             except Exception:
                 # Continue cleaning up other databases even if one fails
                 pass
@@ -191,6 +359,7 @@ async def async_database_pool(
     version: str = None,
     base_port: Optional[int] = None,
     extensions: Optional[Sequence[ExtensionInput]] = None,
+    warm: bool = False,
 ) -> AsyncContextManager[List[str]]:
     """Asynchronously create a pool of independent PostgreSQL databases.
 
@@ -205,6 +374,8 @@ async def async_database_pool(
         extensions: Optional collection of extensions to install immediately
             after each server starts. Entries can be provided in any format
             accepted by :class:`tinypg.ExtensionSpec`.
+        warm: When ``True`` each database is warmed with a ``SELECT 1``
+            query before the URIs are yielded.
 
     Yields:
         list[str]: Connection URIs for the running databases.
@@ -227,24 +398,271 @@ async def async_database_pool(
     try:
         # Start all databases concurrently
         tasks = []
+        ports = _pool_ports(pool_size, base_port)
         for i in range(pool_size):
-            port = None if base_port is None else base_port + i
-
             db = AsyncEphemeralDB(
-                port=port,
+                port=ports[i],
                 cleanup_timeout=timeout,
                 version=version,
+                extensions=extensions,
             )
 
             databases.append(db)
             tasks.append(db.start())
 
-        # Wait for all databases to start
-        uris = await asyncio.gather(*tasks)
+        # Wait for every start to finish, even if one fails or the task is
+        # cancelled meanwhile. Starts run in executor threads, so returning
+        # early would let late servers come up after cleanup already ran.
+        results = await _await_shielded(asyncio.gather(*tasks, return_exceptions=True))
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        uris = list(results)
+        if warm:
+            await asyncio.gather(*(_async_warm_connection(uri) for uri in uris))
         yield uris
 
     finally:
-        # Clean up all databases concurrently
+        # Clean up all databases concurrently. The cleanup is shielded so a
+        # cancellation of the surrounding task cannot orphan postgres servers.
         if databases:
+            _request_immediate_shutdown(databases)
             cleanup_tasks = [db.stop() for db in databases]
-            await asyncio.gather(*cleanup_tasks, return_exceptions=True)
+            await _await_shielded(
+                asyncio.gather(*cleanup_tasks, return_exceptions=True)
+            )
+
+
+@contextmanager
+def database_pool_connections(
+    pool_size: int = 5,
+    timeout: int = 60,
+    version: str = None,
+    base_port: Optional[int] = None,
+    extensions: Optional[Sequence[ExtensionInput]] = None,
+) -> ContextManager[List["connection"]]:
+    """Create a pool of independent databases and yield open connections.
+
+    Behaves like :func:`database_pool` but connects to every database
+    concurrently before yielding, so callers do not pay the connection
+    handshake themselves. Connections are closed before the databases stop.
+
+    Args:
+        pool_size: Number of database instances to start.
+        timeout: Seconds before each database is stopped automatically. Use
+            ``0`` to disable automatic cleanup.
+        version: PostgreSQL version identifier. Defaults to the
+            ``tinypg.config.TinyPGConfig`` value when ``None``.
+        base_port: Base port number. When provided, ports are allocated as
+            ``base_port + i``.
+        extensions: Optional collection of extensions to install immediately
+            after each server starts. Entries can be provided in any format
+            accepted by :class:`tinypg.ExtensionSpec`.
+
+    Yields:
+        list[psycopg2.extensions.connection]: One open connection per database.
+
+    Example:
+        ```python
+        import tinypg
+
+        with tinypg.database_pool_connections(3) as connections:
+            for conn in connections:
+                with conn.cursor() as cur:
+                    cur.execute("SELECT 1")
+        ```
+    """
+    import psycopg2
+
+    with database_pool(
+        pool_size=pool_size,
+        timeout=timeout,
+        version=version,
+        base_port=base_port,
+        extensions=extensions,
+    ) as uris:
+        connections: List[Optional["connection"]] = [None] * len(uris)
+
+        def _connect(i: int) -> None:
+            connections[i] = psycopg2.connect(uris[i])
+
+        try:
+            with ThreadPoolExecutor(max_workers=max(len(uris), 1)) as executor:
+                futures = [executor.submit(_connect, i) for i in range(len(uris))]
+                for future in as_completed(futures):
+                    future.result()
+
+            yield connections
+
+        finally:
+            for conn in connections:
+                if conn is None:
+                    continue
+                try:
+                    conn.close()
+                except Exception:
+                    pass
+
+
+@asynccontextmanager
+async def async_database_pool_connections(
+    pool_size: int = 5,
+    timeout: int = 60,
+    version: str = None,
+    base_port: Optional[int] = None,
+    extensions: Optional[Sequence[ExtensionInput]] = None,
+    connections_per_database: int = 1,
+) -> AsyncContextManager[List["asyncpg.Pool"]]:
+    """Asynchronously create a pool of databases and yield ``asyncpg`` pools.
+
+    Requires the optional ``async`` extra. One :class:`asyncpg.Pool` is
+    created per database, concurrently, with ``connections_per_database``
+    connections opened up front. Pools are closed before the databases stop.
+
+    Args:
+        pool_size: Number of database instances to start.
+        timeout: Seconds before each database is stopped automatically. Use
+            ``0`` to disable automatic cleanup.
+        version: PostgreSQL version identifier. Defaults to the
+            ``tinypg.config.TinyPGConfig`` value when ``None``.
+        base_port: Base port number. When provided, ports are allocated as
+            ``base_port + i``.
+        extensions: Optional collection of extensions to install immediately
+            after each server starts. Entries can be provided in any format
+            accepted by :class:`tinypg.ExtensionSpec`.
+        connections_per_database: Size of each ``asyncpg`` pool.
+
+    Yields:
+        list[asyncpg.Pool]: One connection pool per database.
+
+    Example:
+        ```python
+        import tinypg
+
+        async with tinypg.async_database_pool_connections(3) as pools:
+            for pool in pools:
+                await pool.fetchval("SELECT 1")
+        ```
+    """
+    import asyncpg
+
+    async with async_database_pool(
+        pool_size=pool_size,
+        timeout=timeout,
+        version=version,
+        base_port=base_port,
+        extensions=extensions,
+    ) as uris:
+        results = await asyncio.gather(
+            *(
+                asyncpg.create_pool(
+                    uri,
+                    min_size=connections_per_database,
+                    max_size=connections_per_database,
+                )
+                for uri in uris
+            ),
+            return_exceptions=True,
+        )
+        pools = [pool for pool in results if not isinstance(pool, BaseException)]
+
+        try:
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
+
+            yield pools
+
+        finally:
+            await asyncio.gather(
+                *(pool.close() for pool in pools), return_exceptions=True
+            )
+
+
+@contextmanager
+def database_cluster(
+    pool_size: int = 5,
+    timeout: int = 60,
+    version: str = None,
+    port: Optional[int] = None,
+    postgres_args: Optional[List[str]] = None,
+    extensions: Optional[Sequence[ExtensionInput]] = None,
+) -> ContextManager[List[str]]:
+    """Create several databases inside a single PostgreSQL server.
+
+    Unlike :func:`database_pool`, which starts one server per database, this
+    starts a single server and runs ``CREATE DATABASE`` ``pool_size`` times.
+    Startup cost and memory use stay constant regardless of ``pool_size``, at
+    the price of isolation: all databases share one postmaster, its
+    ``shared_buffers``, connection limit and configuration.
+
+    Args:
+        pool_size: Number of databases to create (``tinypg_0`` ...).
+        timeout: Seconds before the server is stopped automatically. Use
+            ``0`` to disable automatic cleanup.
+        version: PostgreSQL version identifier. Defaults to the
+            ``tinypg.config.TinyPGConfig`` value when ``None``.
+        port: TCP port for the server. When ``None`` a free port is
+            allocated automatically.
+        postgres_args: Extra arguments passed to the ``postgres`` server
+            process.
+        extensions: Optional collection of extensions installed into
+            ``template1`` before the databases are created, so every database
+            starts with them. Entries can be provided in any format accepted
+            by :class:`tinypg.ExtensionSpec`.
+
+    Yields:
+        list[str]: Connection URIs, one per database.
+
+    Example:
+        ```python
+        import psycopg2
+        import tinypg
+
+        with tinypg.database_cluster(3) as uris:
+            connections = [psycopg2.connect(uri) for uri in uris]
+            for conn in connections:
+                conn.close()
+        ```
+    """
+    import psycopg2
+    from psycopg2 import sql
+
+    db = EphemeralDB(
+        port=port,
+        cleanup_timeout=timeout,
+        postgres_args=postgres_args,
+        version=version,
+    )
+
+    try:
+        uri = db.start()
+        names = [f"tinypg_{n}" for n in range(pool_size)]
+
+        if extensions:
+            conn = psycopg2.connect(_uri_with_dbname(uri, "template1"))
+            try:
+                conn.autocommit = True
+                with conn.cursor() as cur:
+                    for extension in extensions:
+                        cur.execute(ExtensionSpec.from_value(extension).to_sql())
+            finally:
+                conn.close()
+
+        # CREATE DATABASE copies template1 and cannot run concurrently against
+        # it, so the databases are created one after another.
+        conn = psycopg2.connect(uri)
+        try:
+            conn.autocommit = True
+            with conn.cursor() as cur:
+                for name in names:
+                    cur.execute(
+                        sql.SQL("CREATE DATABASE {}").format(sql.Identifier(name))
+                    )
+        finally:
+            conn.close()
+
+        yield [_uri_with_dbname(uri, name) for name in names]
+
+    finally:
+        db.stop()
@@ -1,6 +1,7 @@
 """Core ephemeral database implementation."""
 
 import asyncio
+import fcntl
 import getpass
 import grp
 import hashlib
@@ -8,8 +9,11 @@ import os
 import pwd
 import shutil
 import signal
+import stat
 import subprocess
+import sys
 import tempfile
+import threading
 import time
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Sequence, Union
@@ -28,6 +32,7 @@ from .exceptions import (
 )
 from .extensions import ExtensionInput, ExtensionManifest, ExtensionSpec
 from .port_manager import get_free_port
+from .process import pid_exists, wait_for_exit
 
 
 class EphemeralDB:
@@ -108,6 +113,10 @@ class EphemeralDB:
         self._data_dir: Optional[Path] = data_dir
         self._temp_dir: Optional[str] = None
         self._process: Optional[subprocess.Popen] = None
+        self._postmaster_pid: Optional[int] = None
+        self._postmaster_pgid: Optional[int] = None
+        # Serializes shutdowns, e.g. force_kill() racing an in-flight stop()
+        self._stop_lock = threading.Lock()
         self._cleanup_process: Optional[subprocess.Popen] = None
         self._is_running = False
         self._connection_info: Optional[Dict[str, Any]] = None
@@ -163,8 +172,27 @@ class EphemeralDB:
         """Stop the database and clean up resources."""
         self._stop_impl()
 
+    def force_kill(self) -> None:
+        """Kill the server with SIGKILL and clean up without a graceful shutdown.
+
+        Intended as a last resort when a graceful :meth:`stop` takes too
+        long. Safe to call while a stop is in flight on another thread: the
+        signal goes out immediately and cleanup is serialized with it.
+        """
+        pid = self._postmaster_pid
+
+        if pid is not None and self._signal_postmaster(signal.SIGKILL):
+            wait_for_exit(pid, timeout=5)
+
+        self._stop_impl()
+
     def _stop_impl(self) -> None:
         """Internal implementation of :meth:`stop`."""
+        with self._stop_lock:
+            self._stop_locked()
+
+    def _stop_locked(self) -> None:
+        """Stop the server; callers must hold ``_stop_lock``."""
         if not self._is_running:
             return
 
@@ -178,8 +206,9 @@ class EphemeralDB:
                     pass
                 self._cleanup_process = None
 
-            # Stop PostgreSQL server
-            if self._process:
+            # Stop PostgreSQL server. Without a known postmaster PID this
+            # falls back to ``pg_ctl stop`` on the data directory.
+            if self._postmaster_pid is not None or self._data_dir is not None:
                 self._stop_postgres_server()
 
             # Clean up data directory
@@ -190,6 +219,8 @@ class EphemeralDB:
         finally:
             self._is_running = False
             self._process = None
+            self._postmaster_pid = None
+            self._postmaster_pgid = None
             self._connection_info = None
 
     def is_running(self) -> bool:
@@ -197,8 +228,8 @@ class EphemeralDB:
         if not self._is_running:
             return False
 
-        # Check if process is still alive
-        if self._process and self._process.poll() is not None:
+        # Check if the postmaster is still alive
+        if self._postmaster_pid is not None and not pid_exists(self._postmaster_pid):
             self._is_running = False
             return False
 
@@ -221,6 +252,15 @@ class EphemeralDB:
 
     def execute_sql(self, statement: Union[str, "Composable"]) -> None:
         """Execute SQL directly on the database."""
+        self._execute_sql(statement)
+
+    def _execute_sql(self, statement: Union[str, "Composable"]) -> None:
+        """Synchronous implementation of :meth:`execute_sql`.
+
+        Internal callers use this directly so they keep working when a
+        subclass (such as :class:`AsyncEphemeralDB`) overrides the public
+        method with a coroutine.
+        """
         if not self._is_running:
             raise DatabaseStartError("Database is not running")
 
@@ -260,7 +300,7 @@ class EphemeralDB:
             raise DatabaseStartError("Database is not running")
 
         spec = ExtensionSpec.from_value(extension)
-        self.execute_sql(spec.to_sql())
+        self._execute_sql(spec.to_sql())
 
     def create_extension(self, extension: ExtensionInput) -> None:
         """Alias for :meth:`install_extension` to mirror SQL semantics."""
@@ -270,8 +310,26 @@ class EphemeralDB:
     def install_extensions(self, extensions: Iterable[ExtensionInput]) -> None:
         """Install multiple PostgreSQL extensions on the running database."""
 
-        for extension in extensions:
-            self.install_extension(extension)
+        if not self._is_running:
+            raise DatabaseStartError("Database is not running")
+
+        self._create_extensions(self._normalize_extensions(list(extensions)))
+
+    def _create_extensions(self, specs: Sequence[ExtensionSpec]) -> None:
+        """Create extensions in a single round trip.
+
+        The statements are sent as one batch over one connection, and are
+        deliberately not run in parallel: concurrent ``CREATE EXTENSION``
+        calls in the same database race on the catalogs and on shared
+        ``CASCADE`` dependencies.
+        """
+
+        if not specs:
+            return
+
+        from psycopg2 import sql
+
+        self._execute_sql(sql.SQL("; ").join([spec.to_sql() for spec in specs]))
 
     def _normalize_extensions(
         self, extensions: Optional[Sequence[ExtensionInput]]
@@ -334,29 +392,54 @@ class EphemeralDB:
         }
 
         if capture_output:
-            run_kwargs["capture_output"] = True
+            # Only stderr is used (for error reporting), so discard stdout
+            # rather than buffering it in memory.
+            run_kwargs["stdout"] = subprocess.DEVNULL
+            run_kwargs["stderr"] = subprocess.PIPE
 
         if self._drop_privileges:
             uid = self._runtime_uid
             gid = self._runtime_gid
             username = self._runtime_user
 
-            def demote() -> None:
-                try:
-                    groups = os.getgrouplist(username, gid)
-                except OSError:
-                    groups = [gid]
+            try:
+                groups = os.getgrouplist(username, gid)
+            except OSError:
+                groups = [gid]
+
+            if sys.version_info >= (3, 9):
+                # Let subprocess switch identity in C. Unlike preexec_fn this
+                # runs no Python code between fork and exec, which keeps it
+                # safe when databases are started from worker threads.
+                run_kwargs["user"] = uid
+                run_kwargs["group"] = gid
+                run_kwargs["extra_groups"] = groups
+            else:
 
-                os.setgroups(groups)
-                os.setgid(gid)
-                os.setuid(uid)
+                def demote() -> None:
+                    os.setgroups(groups)
+                    os.setgid(gid)
+                    os.setuid(uid)
 
-            run_kwargs["preexec_fn"] = demote
+                run_kwargs["preexec_fn"] = demote
 
         return subprocess.run(
             args, **{k: v for k, v in run_kwargs.items() if v is not None}
         )
 
+    @staticmethod
+    def _describe_process_error(error: subprocess.CalledProcessError) -> str:
+        """Format a failed helper command, including its stderr output."""
+
+        stderr = error.stderr
+        if isinstance(stderr, bytes):
+            stderr = stderr.decode("utf-8", errors="replace")
+
+        if stderr and stderr.strip():
+            return f"{error}: {stderr.strip()}"
+
+        return str(error)
+
     def _ensure_directory_owner(
         self, path: Path, mode: int = 0o700, *, create: bool = True
     ) -> None:
@@ -373,8 +456,12 @@ class EphemeralDB:
         if self._drop_privileges:
             shutil.chown(path, self._runtime_uid, self._runtime_gid)
 
-    def _ensure_runtime_access(self, path: Path) -> None:
-        """Ensure the runtime PostgreSQL user can traverse the given path."""
+    def _ensure_runtime_access(self, path: Path, root: Optional[Path] = None) -> None:
+        """Ensure the runtime PostgreSQL user can traverse the given path.
+
+        Only directories below the system temp directory, or below ``root``
+        when given, are adjusted.
+        """
 
         if not self._drop_privileges:
             return
@@ -387,7 +474,9 @@ class EphemeralDB:
         temp_root = TinyPGConfig.get_temp_dir().resolve()
 
         if not resolved.is_relative_to(temp_root):
-            return
+            if root is None or not resolved.is_relative_to(root.resolve()):
+                return
+            temp_root = root.resolve()
 
         current = resolved
 
@@ -401,6 +490,47 @@ class EphemeralDB:
 
             current = current.parent
 
+    def _require_runtime_access(self, path: Path, setting: str) -> None:
+        """Fail early if the runtime PostgreSQL user cannot traverse ``path``.
+
+        Directories outside the system temp directory are not chmod-ed by
+        :meth:`_ensure_runtime_access` beyond the configured directory
+        itself, so e.g. a directory below a ``0700`` home directory would
+        otherwise surface as an obscure ``initdb`` permission error.
+
+        Raises:
+            InitDBError: If ``path`` or one of its ancestors is not
+                traversable by the runtime user
+        """
+
+        if not self._drop_privileges:
+            return
+
+        try:
+            groups = set(os.getgrouplist(self._runtime_user, self._runtime_gid))
+        except OSError:
+            groups = {self._runtime_gid}
+
+        resolved = path.resolve()
+
+        for directory in [resolved, *resolved.parents]:
+            info = directory.stat()
+
+            if info.st_uid == self._runtime_uid:
+                bit = stat.S_IXUSR
+            elif info.st_gid in groups:
+                bit = stat.S_IXGRP
+            else:
+                bit = stat.S_IXOTH
+
+            if not info.st_mode & bit:
+                raise InitDBError(
+                    f"{setting} {path} is not reachable by the PostgreSQL "
+                    f"runtime user {self._runtime_user!r}: {directory} is not "
+                    "traversable. Grant it execute permission (e.g. chmod o+x) "
+                    "or choose a different directory."
+                )
+
     def load_sql_file(self, file_path: Path) -> None:
         """Load and execute SQL from a file."""
         if not file_path.exists():
@@ -410,12 +540,19 @@ class EphemeralDB:
         with open(file_path, "r") as f:
             sql_content = f.read()
 
-        self.execute_sql(sql_content)
+        self._execute_sql(sql_content)
 
     def _initialize_database(self) -> Path:
         """Initialize a new PostgreSQL database cluster."""
         # Create temporary directory
-        self._temp_dir = tempfile.mkdtemp(prefix="tinypg.")
+        data_root = TinyPGConfig.get_data_root()
+        if data_root is not None:
+            # Only the tmpfs directory itself is opened up; its ancestors are
+            # left alone, so fail early if one of them blocks the runtime user.
+            self._ensure_runtime_access(data_root, root=data_root)
+            self._require_runtime_access(data_root, "tmpfs_dir")
+
+        self._temp_dir = tempfile.mkdtemp(prefix="tinypg.", dir=data_root)
         temp_path = Path(self._temp_dir)
 
         # Ensure the PostgreSQL runtime user owns the temp directory so that
@@ -427,26 +564,10 @@ class EphemeralDB:
         data_dir = temp_path / self.version
 
         try:
-            # Run initdb
-            initdb_path = PostgreSQLBinaries.get_binary_path("initdb", self.version)
-
-            self._run_command(
-                [
-                    str(initdb_path),
-                    "--nosync",
-                    "-D",
-                    str(data_dir),
-                    "-E",
-                    "UNICODE",
-                    "-A",
-                    "trust",
-                    "-U",
-                    self._connection_user,
-                ],
-                capture_output=True,
-                cwd=temp_path,
-                env=self._build_command_environment(),
-            )
+            if TinyPGConfig.template_cache_dir is not None:
+                self._clone_template(self._ensure_template(), data_dir)
+            else:
+                self._run_initdb(data_dir, cwd=temp_path)
 
             # Configure PostgreSQL for ephemeral use
             self._configure_postgresql(data_dir)
@@ -454,7 +575,120 @@ class EphemeralDB:
             return data_dir
 
         except subprocess.CalledProcessError as e:
-            raise InitDBError(f"Failed to initialize database: {e}")
+            raise InitDBError(
+                f"Failed to initialize database: {self._describe_process_error(e)}"
+            )
+
+    def _run_initdb(self, data_dir: Path, cwd: Path) -> None:
+        """Run ``initdb`` for an ephemeral cluster in ``data_dir``."""
+        initdb_path = PostgreSQLBinaries.get_binary_path("initdb", self.version)
+
+        self._run_command(
+            [
+                str(initdb_path),
+                "--nosync",
+                "-D",
+                str(data_dir),
+                "-E",
+                "UNICODE",
+                "-A",
+                "trust",
+                "-U",
+                self._connection_user,
+            ],
+            capture_output=True,
+            cwd=cwd,
+            env=self._build_command_environment(),
+        )
+
+    def _ensure_template(self) -> Path:
+        """Return the cached initdb template, creating it if needed.
+
+        Templates are keyed by the inputs that influence the ``initdb``
+        output: PostgreSQL version, superuser name, runtime uid, every
+        ``LC_*`` locale category, ``LANG`` and ``TZ``. When ``TZ`` is unset
+        initdb falls back to the system timezone; changing that (e.g.
+        ``/etc/localtime``) is not detected, so clear the template cache
+        afterwards. Creation is serialized with an ``flock`` so concurrent processes and
+        threads build each template only once.
+        """
+        cache_dir = Path(TinyPGConfig.template_cache_dir)
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        self._ensure_runtime_access(cache_dir, root=cache_dir)
+        self._require_runtime_access(cache_dir, "template_cache_dir")
+
+        locale_env = [
+            os.environ.get(name, "")
+            for name in (
+                "LC_ALL",
+                "LC_COLLATE",
+                "LC_CTYPE",
+                "LC_MESSAGES",
+                "LC_MONETARY",
+                "LC_NUMERIC",
+                "LC_TIME",
+                "LANG",
+                "TZ",
+            )
+        ]
+        key = "\0".join(
+            [self.version, self._connection_user, str(self._runtime_uid)] + locale_env
+        )
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()[:12]
+        name = f"postgresql-{self.version}-{digest}"
+        template_dir = cache_dir / name
+
+        if template_dir.exists():
+            return template_dir
+
+        with open(cache_dir / f"{name}.lock", "w") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                if template_dir.exists():
+                    return template_dir
+
+                # Build in a staging directory and rename into place so a
+                # partially initialized template is never visible.
+                staging = Path(tempfile.mkdtemp(prefix=f"{name}.", dir=cache_dir))
+                try:
+                    self._ensure_directory_owner(staging, create=False)
+                    self._run_initdb(staging / "data", cwd=staging)
+                    os.rename(staging / "data", template_dir)
+                finally:
+                    shutil.rmtree(staging, ignore_errors=True)
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+        return template_dir
+
+    def _clone_template(self, template_dir: Path, data_dir: Path) -> None:
+        """Copy an initdb template into ``data_dir``."""
+        if sys.platform.startswith("linux"):
+            # Reflinks make the copy nearly free on CoW filesystems; cp -a
+            # also preserves ownership when running as root.
+            try:
+                subprocess.run(
+                    ["cp", "-a", "--reflink=auto", str(template_dir), str(data_dir)],
+                    check=True,
+                    capture_output=True,
+                )
+                return
+            except (subprocess.CalledProcessError, FileNotFoundError):
+                # e.g. busybox cp without --reflink support
+                shutil.rmtree(data_dir, ignore_errors=True)
+
+        shutil.copytree(template_dir, data_dir, symlinks=True)
+
+        if self._drop_privileges:
+            for root, dirs, files in os.walk(data_dir):
+                for entry in dirs + files:
+                    os.chown(
+                        os.path.join(root, entry),
+                        self._runtime_uid,
+                        self._runtime_gid,
+                        follow_symlinks=False,
+                    )
+            os.chown(data_dir, self._runtime_uid, self._runtime_gid)
 
     def _configure_postgresql(self, data_dir: Path) -> None:
         """Configure PostgreSQL for ephemeral use (based on pg_tmp.sh)."""
@@ -480,11 +714,7 @@ log_disconnections = on
     def _install_extensions(self) -> None:
         """Install user-requested extensions on the running database."""
 
-        if not self._extensions:
-            return
-
-        for extension in self._extensions:
-            self.execute_sql(extension.to_sql())
+        self._create_extensions(self._extensions)
 
     def _start_postgres_server(self) -> None:
         """Start the PostgreSQL server process."""
@@ -526,11 +756,67 @@ log_disconnections = on
             # Give PostgreSQL a brief moment after pg_ctl reports success.
             time.sleep(0.1)
 
+            self._postmaster_pid = self._read_postmaster_pid()
+            if self._postmaster_pid is not None:
+                try:
+                    self._postmaster_pgid = os.getpgid(self._postmaster_pid)
+                except OSError:
+                    self._postmaster_pgid = None
+
         except subprocess.CalledProcessError as e:
-            raise DatabaseStartError(f"Failed to start PostgreSQL server: {e}")
+            raise DatabaseStartError(
+                f"Failed to start PostgreSQL server: {self._describe_process_error(e)}"
+            )
+
+    def _read_postmaster_pid(self) -> Optional[int]:
+        """Read the postmaster PID from ``postmaster.pid`` in the data directory."""
+        try:
+            with open(self._data_dir / "postmaster.pid", "r") as f:
+                return int(f.readline().strip())
+        except (OSError, ValueError):
+            return None
+
+    def _signal_postmaster(self, sig: int) -> bool:
+        """Send ``sig`` to the postmaster.
+
+        ``pg_ctl`` starts the postmaster in its own session, in which case the
+        whole process group (postmaster and backends) is signalled at once.
+
+        Returns:
+            bool: True if the signal was delivered
+        """
+        pid = self._postmaster_pid
+
+        if pid is None:
+            return False
+
+        try:
+            if self._postmaster_pgid == pid:
+                os.killpg(pid, sig)
+            else:
+                os.kill(pid, sig)
+        except OSError:
+            return False
+
+        return True
 
     def _stop_postgres_server(self) -> None:
         """Stop the PostgreSQL server."""
+        pid = self._postmaster_pid
+
+        if pid is not None:
+            # SIGINT requests a "fast" shutdown, the same mode ``pg_ctl stop``
+            # uses. Waiting on the PID directly avoids pg_ctl's 100ms polling.
+            try:
+                os.kill(pid, signal.SIGINT)
+            except ProcessLookupError:
+                return
+            except PermissionError:
+                pass
+            else:
+                if wait_for_exit(pid, timeout=30):
+                    return
+
         try:
             pg_ctl_path = PostgreSQLBinaries.get_binary_path("pg_ctl", self.version)
 
@@ -607,6 +893,11 @@ class AsyncEphemeralDB(EphemeralDB):
         loop = asyncio.get_event_loop()
         await loop.run_in_executor(None, super().stop)
 
+    async def force_kill(self) -> None:
+        """Async version of force_kill()."""
+        loop = asyncio.get_event_loop()
+        await loop.run_in_executor(None, super().force_kill)
+
     async def execute_sql(self, statement: Union[str, "Composable"]) -> None:
         """Execute SQL asynchronously."""
         loop = asyncio.get_event_loop()
@@ -3,7 +3,7 @@ Port management utilities - Python implementation of getsocket.c functionality.
 """
 
 import socket
-from typing import Optional
+from typing import List, Optional
 
 
 def get_free_port() -> int:
@@ -25,6 +25,32 @@ def get_free_port() -> int:
         sock.close()
 
 
+def get_free_ports(count: int) -> List[int]:
+    """
+    Get several distinct unused TCP ports at once.
+
+    All sockets stay bound until every port has been assigned, so the kernel
+    cannot hand out the same port twice.
+
+    Args:
+        count: Number of ports to allocate
+
+    Returns:
+        List[int]: Available TCP port numbers
+    """
+    sockets = []
+    try:
+        for _ in range(count):
+            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            sockets.append(sock)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            sock.bind(("0.0.0.0", 0))
+        return [sock.getsockname()[1] for sock in sockets]
+    finally:
+        for sock in sockets:
+            sock.close()
+
+
 def is_port_available(port: int, host: str = "127.0.0.1") -> bool:
     """
     Check if a port is available for binding.
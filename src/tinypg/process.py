@@ -0,0 +1,95 @@
+"""
+Process management utilities for PostgreSQL server processes.
+"""
+
+import os
+import select
+import time
+from typing import Optional
+
+
+def _pidfd_open(pid: int) -> Optional[int]:
+    """
+    Open a pidfd for ``pid`` when the platform supports it.
+
+    Returns:
+        Optional[int]: File descriptor, or None if pidfds are unavailable
+
+    Raises:
+        ProcessLookupError: If the process does not exist
+    """
+    if not hasattr(os, "pidfd_open"):
+        return None
+
+    try:
+        return os.pidfd_open(pid)
+    except ProcessLookupError:
+        raise
+    except OSError:
+        # Kernel older than 5.3 (ENOSYS) or blocked by a seccomp profile
+        return None
+
+
+def pid_exists(pid: int) -> bool:
+    """
+    Check whether a process with the given PID is alive.
+
+    Args:
+        pid: Process ID to check
+
+    Returns:
+        bool: True if the process exists, False otherwise
+    """
+    try:
+        # Reap the process if it happens to be our (zombie) child
+        os.waitpid(pid, os.WNOHANG)
+    except ChildProcessError:
+        pass
+
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def wait_for_exit(pid: int, timeout: Optional[float] = None) -> bool:
+    """
+    Wait for a process to exit. The process does not need to be a child.
+
+    On Linux 5.3+ this blocks on a pidfd so the exit is noticed immediately;
+    elsewhere it falls back to polling with a short exponential backoff.
+
+    Args:
+        pid: Process ID to wait for
+        timeout: Maximum number of seconds to wait (None waits forever)
+
+    Returns:
+        bool: True if the process exited, False if the timeout expired
+    """
+    try:
+        pidfd = _pidfd_open(pid)
+    except ProcessLookupError:
+        return True
+
+    if pidfd is not None:
+        try:
+            poller = select.poll()
+            poller.register(pidfd, select.POLLIN)
+            timeout_ms = None if timeout is None else max(int(timeout * 1000), 0)
+            return bool(poller.poll(timeout_ms))
+        finally:
+            os.close(pidfd)
+
+    deadline = None if timeout is None else time.monotonic() + timeout
+    delay = 0.001
+
+    while pid_exists(pid):
+        if deadline is not None and time.monotonic() >= deadline:
+            return False
+        time.sleep(delay)
+        delay = min(delay * 2, 0.05)
+
+    return True
@@ -2,11 +2,15 @@
 Basic tests for TinyPG functionality.
 """
 
+import os
+
 import psycopg2
 import pytest
 
 import tinypg
 from tinypg import EphemeralDB
+from tinypg.binaries import PostgreSQLBinaries
+from tinypg.exceptions import InitDBError
 
 
 def test_port_manager():
@@ -22,6 +26,22 @@ def test_port_manager():
     assert is_port_available(port)
 
 
+def test_dir_lists_public_api():
+    """``dir(tinypg)`` lists the public API but not import helpers."""
+    names = dir(tinypg)
+
+    assert set(tinypg.__all__) <= set(names)
+    assert not {"importlib", "TYPE_CHECKING", "Any", "List", "_LAZY"} & set(names)
+
+
+def test_get_free_ports():
+    """Ports allocated together are distinct."""
+    from tinypg.port_manager import get_free_ports
+
+    ports = get_free_ports(5)
+    assert len(ports) == len(set(ports)) == 5
+
+
 def test_ephemeral_db_basic():
     """Test basic EphemeralDB functionality."""
     db = EphemeralDB(cleanup_timeout=0)  # Disable auto-cleanup for testing
@@ -122,3 +142,163 @@ def test_database_pool():
                 cur.execute(f"CREATE TABLE pool_test_{i} (id INT)")
                 cur.execute(f"INSERT INTO pool_test_{i} VALUES ({i})")
             conn.close()
+
+
+def test_context_manager_warm():
+    """Warm databases are immediately usable."""
+    with tinypg.database(timeout=0, warm=True) as uri:
+        conn = psycopg2.connect(uri)
+        with conn.cursor() as cur:
+            cur.execute("SELECT 1")
+            assert cur.fetchone()[0] == 1
+        conn.close()
+
+
+def test_database_pool_connections():
+    """Pool connections are open on entry and closed on exit."""
+    with tinypg.database_pool_connections(pool_size=2, timeout=0) as connections:
+        assert len(connections) == 2
+
+        for conn in connections:
+            with conn.cursor() as cur:
+                cur.execute("SELECT 1")
+                assert cur.fetchone()[0] == 1
+
+    assert all(conn.closed for conn in connections)
+
+
+@pytest.mark.asyncio
+async def test_async_database_pool_connections():
+    """Async connection pools are usable on entry and closed on exit."""
+    pytest.importorskip("asyncpg")
+
+    async with tinypg.async_database_pool_connections(
+        pool_size=2, timeout=0, connections_per_database=2
+    ) as pools:
+        assert len(pools) == 2
+
+        for pool in pools:
+            assert await pool.fetchval("SELECT 1") == 1
+
+    assert all(pool.is_closing() for pool in pools)
+
+
+def test_initdb_template(tmp_path, monkeypatch):
+    """Databases can be cloned from a cached initdb template."""
+    monkeypatch.setattr(tinypg.TinyPGConfig, "template_cache_dir", tmp_path)
+
+    with tinypg.database_pool(pool_size=2, timeout=0) as uris:
+        for uri in uris:
+            conn = psycopg2.connect(uri)
+            with conn.cursor() as cur:
+                cur.execute("SELECT 1")
+                assert cur.fetchone()[0] == 1
+            conn.close()
+
+    templates = [path for path in tmp_path.iterdir() if path.is_dir()]
+    assert len(templates) == 1
+    assert (templates[0] / "PG_VERSION").exists()
+
+
+def test_tmpfs_data_dir(monkeypatch, tmp_path):
+    """Data directories are created below the configured tmpfs directory."""
+    monkeypatch.setattr(tinypg.TinyPGConfig, "use_tmpfs", True)
+    monkeypatch.setattr(tinypg.TinyPGConfig, "tmpfs_dir", str(tmp_path))
+
+    db = EphemeralDB(cleanup_timeout=0)
+
+    try:
+        db.start()
+        assert db._temp_dir.startswith(str(tmp_path))
+        db.execute_sql("SELECT 1")
+    finally:
+        db.stop()
+
+
+def test_database_cluster():
+    """A cluster serves several isolated databases from one server."""
+    with tinypg.database_cluster(pool_size=3, timeout=0) as uris:
+        assert len(uris) == 3
+
+        names = []
+        for uri in uris:
+            conn = psycopg2.connect(uri)
+            with conn.cursor() as cur:
+                cur.execute("SELECT current_database()")
+                names.append(cur.fetchone()[0])
+            conn.close()
+
+        assert names == ["tinypg_0", "tinypg_1", "tinypg_2"]
+
+
+def test_force_kill():
+    """force_kill terminates the postmaster without a graceful shutdown."""
+    from tinypg.process import pid_exists
+
+    db = EphemeralDB(cleanup_timeout=0)
+
+    try:
+        db.start()
+        pid = db._postmaster_pid
+        assert pid is not None
+
+        db.force_kill()
+
+        assert not db.is_running()
+        assert not pid_exists(pid)
+    finally:
+        db.stop()
+
+
+def test_stop_without_postmaster_pid_uses_pg_ctl(tmp_path, monkeypatch):
+    """stop() still shuts the server down when postmaster.pid was unreadable."""
+    monkeypatch.setattr(PostgreSQLBinaries, "ensure_version", lambda version: None)
+
+    db = EphemeralDB(cleanup_timeout=0)
+    # A server that started but whose postmaster.pid could not be read
+    db._is_running = True
+    db._data_dir = tmp_path
+
+    calls = []
+    monkeypatch.setattr(db, "_stop_postgres_server", lambda: calls.append(True))
+
+    db.stop()
+
+    assert calls == [True]
+    assert not db.is_running()
+
+
+@pytest.mark.skipif(os.geteuid() != 0, reason="privilege drop only happens as root")
+def test_template_cache_dir_must_be_reachable(tmp_path, monkeypatch):
+    """An unreachable template cache directory fails with a clear error."""
+    monkeypatch.setattr(PostgreSQLBinaries, "ensure_version", lambda version: None)
+    monkeypatch.setattr(tinypg.TinyPGConfig, "system_temp_dir", str(tmp_path / "t"))
+
+    locked = tmp_path / "locked"
+    locked.mkdir(mode=0o700)
+    monkeypatch.setattr(tinypg.TinyPGConfig, "template_cache_dir", locked / "tpl")
+
+    db = EphemeralDB(cleanup_timeout=0)
+
+    with pytest.raises(InitDBError, match="template_cache_dir"):
+        db._ensure_template()
+
+
+@pytest.mark.skipif(os.geteuid() != 0, reason="privilege drop only happens as root")
+def test_tmpfs_dir_must_be_reachable(tmp_path, monkeypatch):
+    """An unreachable tmpfs directory fails before anything is created in it."""
+    monkeypatch.setattr(PostgreSQLBinaries, "ensure_version", lambda version: None)
+    monkeypatch.setattr(tinypg.TinyPGConfig, "system_temp_dir", str(tmp_path / "t"))
+
+    locked = tmp_path / "locked"
+    locked.mkdir(mode=0o700)
+    tmpfs = locked / "shm"
+    tmpfs.mkdir()
+    monkeypatch.setattr(tinypg.TinyPGConfig, "use_tmpfs", True)
+    monkeypatch.setattr(tinypg.TinyPGConfig, "tmpfs_dir", str(tmpfs))
+
+    db = EphemeralDB(cleanup_timeout=0)
+
+    with pytest.raises(InitDBError, match="tmpfs_dir"):
+        db._initialize_database()
+    assert list(tmpfs.iterdir()) == []
@@ -0,0 +1,56 @@
+"""Tests for PostgreSQL binary resolution helpers."""
+
+from tinypg import TinyPGConfig, binaries
+from tinypg.binaries import PostgreSQLBinaries
+
+
+def test_ensure_version_is_cached_per_process(tmp_path, monkeypatch):
+    """Repeated ``ensure_version`` calls only resolve the version once."""
+
+    monkeypatch.setattr(TinyPGConfig, "cache_dir", tmp_path)
+    monkeypatch.setattr(binaries, "_READY_VERSIONS", {})
+
+    calls = []
+
+    def fake_resolve(cls, version):
+        calls.append(version)
+        return tmp_path / f"postgresql-{version}"
+
+    monkeypatch.setattr(
+        PostgreSQLBinaries, "_resolve_version", classmethod(fake_resolve)
+    )
+
+    first = PostgreSQLBinaries.ensure_version("15")
+    second = PostgreSQLBinaries.ensure_version("15")
+
+    assert first == second == tmp_path / "postgresql-15"
+    assert calls == ["15"]
+
+
+def test_get_binary_path_is_cached_per_process(tmp_path, monkeypatch):
+    """Binary lookups are resolved once and revalidated on reuse."""
+
+    monkeypatch.setattr(TinyPGConfig, "cache_dir", tmp_path)
+    monkeypatch.setattr(binaries, "_BINARY_PATHS", {})
+
+    binary = tmp_path / "pg_ctl"
+    binary.write_text("#!/bin/sh\n")
+    binary.chmod(0o755)
+
+    calls = []
+
+    def fake_resolve(cls, binary_name, version):
+        calls.append((binary_name, version))
+        return binary
+
+    monkeypatch.setattr(
+        PostgreSQLBinaries, "_resolve_binary_path", classmethod(fake_resolve)
+    )
+
+    assert PostgreSQLBinaries.get_binary_path("pg_ctl", "15") == binary
+    assert PostgreSQLBinaries.get_binary_path("pg_ctl", "15") == binary
+    assert calls == [("pg_ctl", "15")]
+
+    binary.unlink()
+    PostgreSQLBinaries.get_binary_path("pg_ctl", "15")
+    assert len(calls) == 2
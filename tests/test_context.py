@@ -0,0 +1,181 @@
+"""Tests for context manager helpers."""
+
+import asyncio
+import signal
+import time
+
+import pytest
+
+from tinypg import context
+from tinypg.context import _await_shielded, _uri_with_dbname
+from tinypg.exceptions import DatabaseStartError
+
+
+@pytest.mark.asyncio
+async def test_await_shielded_survives_cancellation():
+    """Shielded cleanup completes before the cancellation propagates."""
+
+    finished = []
+
+    async def cleanup():
+        await asyncio.sleep(0.1)
+        finished.append(True)
+
+    async def body():
+        try:
+            await asyncio.sleep(10)
+        finally:
+            await _await_shielded(cleanup())
+
+    task = asyncio.ensure_future(body())
+    await asyncio.sleep(0.01)
+    task.cancel()
+    await asyncio.sleep(0.01)
+    task.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert finished == [True]
+
+
+def test_uri_with_dbname():
+    """Database names are substituted for TCP and Unix-socket URIs."""
+
+    assert (
+        _uri_with_dbname("postgresql://me@127.0.0.1:5432/postgres", "tinypg_1")
+        == "postgresql://me@127.0.0.1:5432/tinypg_1"
+    )
+    assert (
+        _uri_with_dbname("postgresql:///postgres?host=%2Ftmp%2Fpg", "tinypg_1")
+        == "postgresql:///tinypg_1?host=%2Ftmp%2Fpg"
+    )
+
+
+@pytest.mark.asyncio
+async def test_async_database_pool_stops_members_after_failed_start(monkeypatch):
+    """Members still starting when a peer fails are stopped once they are up."""
+
+    instances = []
+
+    class FakeAsyncEphemeralDB:
+        def __init__(self, port=None, **kwargs):
+            self.fail = not instances
+            self.running = False
+            self.stopped_while_running = False
+            instances.append(self)
+
+        async def start(self):
+            if self.fail:
+                raise DatabaseStartError("boom")
+            await asyncio.sleep(0.05)
+            self.running = True
+            return "postgresql://fake"
+
+        def _signal_postmaster(self, sig):
+            return False
+
+        async def stop(self):
+            self.stopped_while_running = self.running
+            self.running = False
+
+    monkeypatch.setattr(context, "AsyncEphemeralDB", FakeAsyncEphemeralDB)
+
+    with pytest.raises(DatabaseStartError):
+        async with context.async_database_pool(pool_size=3):
+            pass
+
+    assert len(instances) == 3
+    assert all(db.stopped_while_running for db in instances[1:])
+    assert not any(db.running for db in instances)
+
+
+@pytest.mark.asyncio
+async def test_async_database_second_cancel_kills_and_waits_for_stop(monkeypatch):
+    """A second cancellation SIGKILLs the server and awaits the pending stop."""
+
+    events = []
+
+    class FakeAsyncEphemeralDB:
+        def __init__(self, **kwargs):
+            pass
+
+        async def start(self):
+            return "postgresql://fake"
+
+        def _signal_postmaster(self, sig):
+            events.append(("signal", sig))
+            return True
+
+        async def stop(self):
+            events.append("stop started")
+            await asyncio.sleep(0.1)
+            events.append("stop finished")
+
+    monkeypatch.setattr(context, "AsyncEphemeralDB", FakeAsyncEphemeralDB)
+
+    async def body():
+        async with context.async_database():
+            await asyncio.sleep(10)
+
+    task = asyncio.ensure_future(body())
+    await asyncio.sleep(0.01)
+    task.cancel()
+    await asyncio.sleep(0.01)
+    task.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert events == [
+        "stop started",
+        ("signal", signal.SIGKILL),
+        "stop finished",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_async_database_cancel_during_start_stops_server(monkeypatch):
+    """Cancelling while the server starts still stops it once it is up."""
+
+    instances = []
+
+    class FakeAsyncEphemeralDB:
+        def __init__(self, **kwargs):
+            self.running = False
+            instances.append(self)
+
+        def _blocking_start(self):
+            time.sleep(0.1)
+            self.running = True
+            return "postgresql://fake"
+
+        async def start(self):
+            # Like AsyncEphemeralDB, the thread keeps going after a cancel
+            loop = asyncio.get_event_loop()
+            return await loop.run_in_executor(None, self._blocking_start)
+
+        def _signal_postmaster(self, sig):
+            return False
+
+        async def stop(self):
+            self.running = False
+
+    monkeypatch.setattr(context, "AsyncEphemeralDB", FakeAsyncEphemeralDB)
+
+    async def body():
+        async with context.async_database():
+            await asyncio.sleep(10)
+
+    task = asyncio.ensure_future(body())
+    await asyncio.sleep(0.01)
+    task.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    # Give a start that outlived the cleanup time to finish
+    await asyncio.sleep(0.2)
+
+    assert len(instances) == 1
+    assert not instances[0].running
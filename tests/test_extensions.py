@@ -1,9 +1,11 @@
 """Tests covering TinyPG extension discovery and installation."""
 
 import psycopg2
+import pytest
 from psycopg2 import sql
 
 from tinypg import (
+    AsyncEphemeralDB,
     EphemeralDB,
     ExtensionManifest,
     ExtensionSpec,
@@ -57,6 +59,52 @@ def test_extension_installation_after_start():
         db.stop()
 
 
+def test_install_multiple_extensions():
+    """Several extensions can be installed in one call."""
+
+    db = EphemeralDB(cleanup_timeout=0)
+
+    conn = None
+
+    try:
+        db.start()
+        db.install_extensions(["pgcrypto", {"name": "hstore"}])
+
+        conn = psycopg2.connect(db.get_connection_info()["uri"])
+
+        with conn.cursor() as cur:
+            cur.execute(
+                "SELECT extname FROM pg_extension"
+                " WHERE extname IN ('pgcrypto', 'hstore') ORDER BY extname"
+            )
+            assert [row[0] for row in cur.fetchall()] == ["hstore", "pgcrypto"]
+    finally:
+        if conn is not None:
+            conn.close()
+        db.stop()
+
+
+@pytest.mark.asyncio
+async def test_async_extension_installation_on_startup():
+    """AsyncEphemeralDB installs extensions requested at construction."""
+
+    db = AsyncEphemeralDB(cleanup_timeout=0, extensions=["pgcrypto"])
+
+    conn = None
+
+    try:
+        await db.start()
+        conn = psycopg2.connect(db.get_connection_info()["uri"])
+
+        with conn.cursor() as cur:
+            cur.execute("SELECT extname FROM pg_extension WHERE extname = 'pgcrypto'")
+            assert cur.fetchone()[0] == "pgcrypto"
+    finally:
+        if conn is not None:
+            conn.close()
+        await db.stop()
+
+
 def test_extension_spec_sql_composition_is_safe():
     """Extension specifications produce safely quoted SQL statements."""
 
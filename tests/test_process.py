@@ -0,0 +1,27 @@
+"""Tests for process management utilities."""
+
+import subprocess
+import sys
+
+import pytest
+
+from tinypg import process
+from tinypg.process import pid_exists, wait_for_exit
+
+
+@pytest.mark.parametrize("use_pidfd", [True, False])
+def test_wait_for_exit(monkeypatch, use_pidfd):
+    """wait_for_exit reports timeouts and detects process exit."""
+
+    if not use_pidfd:
+        monkeypatch.setattr(process, "_pidfd_open", lambda pid: None)
+
+    proc = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(0.3)"])
+
+    try:
+        assert not wait_for_exit(proc.pid, timeout=0.01)
+        assert wait_for_exit(proc.pid, timeout=10)
+    finally:
+        proc.wait()
+
+    assert not pid_exists(proc.pid)